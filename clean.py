@@ -1,9 +1,8 @@
 #!/usr/bin/env python
 """Clean up generated build files and directories."""
 
-import os
 import shutil
-import glob
+from pathlib import Path
 
 
 def clean_build_files():
@@ -17,44 +16,37 @@ def clean_build_files():
         "__pycache__",
     ]
     
-    # File patterns to remove
-    files_to_remove = [
-        "*.c",           # Generated C files
-        "*.html",        # Cython annotation files  
-        "*.so",          # Compiled shared libraries
-        "*.pyd",         # Windows compiled extensions
-        "*.pyc",         # Compiled Python files
-        "**/__pycache__", # Cache directories
-    ]
+    # File suffixes to remove
+    suffixes_to_remove = {
+        ".c",            # Generated C files
+        ".html",         # Cython annotation files
+        ".so",           # Compiled shared libraries
+        ".pyd",          # Windows compiled extensions
+        ".pyc",          # Compiled Python files
+    }
     
     print("Cleaning up generated files...")
     
     # Remove directories
     for dir_name in dirs_to_remove:
-        if os.path.exists(dir_name):
+        if Path(dir_name).exists():
             print(f"Removing directory: {dir_name}")
             shutil.rmtree(dir_name)
     
-    # Remove files by pattern
-    for pattern in files_to_remove:
-        for filepath in glob.glob(pattern, recursive=True):
-            if os.path.isfile(filepath):
-                print(f"Removing file: {filepath}")
-                os.remove(filepath)
-            elif os.path.isdir(filepath):
-                print(f"Removing directory: {filepath}")
-                shutil.rmtree(filepath)
-    
-    # Remove any remaining annotation files in sound subdirectories
-    for root, dirs, files in os.walk("sound"):
-        for file in files:
-            if file.endswith(('.c', '.html', '.so', '.pyd')):
-                filepath = os.path.join(root, file)
-                print(f"Removing: {filepath}")
-                os.remove(filepath)
+    # Remove generated files and caches in a single pass over the project
+    # root and the package tree; other directories (virtualenvs, .git)
+    # are never walked
+    paths = list(Path(".").glob("*")) + list(Path("sound").rglob("*"))
+    for path in paths:
+        if path.name == "__pycache__" and path.is_dir():
+            print(f"Removing directory: {path}")
+            shutil.rmtree(path)
+        elif path.suffix in suffixes_to_remove and path.is_file():
+            print(f"Removing file: {path}")
+            path.unlink()
     
     print("Cleanup complete!")
 
 
 if __name__ == "__main__":
-    clean_build_files() 
\ No newline at end of file
+    clean_build_files()
\ No newline at end of file
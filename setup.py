@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 """Setup script for the sound package with Cython extensions."""
 
+import glob
 import os
+import shutil
+import sysconfig
+import tempfile
 from setuptools import setup, Extension, find_packages
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CompileError, LinkError
 from Cython.Build import cythonize
 import numpy
 
@@ -11,43 +17,122 @@ BUILD_DIR = "build"
 CYTHON_BUILD_DIR = os.path.join(BUILD_DIR, "cython")
 ANNOTATION_DIR = os.path.join(BUILD_DIR, "annotations")
 
+# HTML annotation slows the build down, so only produce it on request
+ANNOTATE = os.environ.get("SOUND_ANNOTATE", "0") == "1"
+
 # Create build directories if they don't exist
 os.makedirs(CYTHON_BUILD_DIR, exist_ok=True)
-os.makedirs(ANNOTATION_DIR, exist_ok=True)
-
-# Define which modules should be compiled as Cython extensions
-cython_modules = [
-    "sound.effects.echo",
-    "sound.effects.reverse", 
-    "sound.effects.surround",
-    "sound.filters.karaoke",
-    "sound.filters.synth",
-    "sound.filters.vocoder",
-    "sound.formats.waveread",
-    "sound.formats.wavewrite",
-]
-
-# Create Extension objects for each Cython module
-extensions = []
-for module_name in cython_modules:
-    # Convert module name to file path
-    pyx_file = module_name.replace(".", "/") + ".py"
-    if os.path.exists(pyx_file):
-        extensions.append(
-            Extension(
-                module_name,
-                [pyx_file],
-                include_dirs=[numpy.get_include()],
-                extra_compile_args=["-O3", "-ffast-math"],
-                extra_link_args=["-O3"],
-            )
+if ANNOTATE:
+    os.makedirs(ANNOTATION_DIR, exist_ok=True)
+
+# Compile every module in the subpackages as a Cython extension. cythonize
+# expands the pattern, derives module names from the paths and tracks
+# cimport/include dependencies, so only changed modules are regenerated.
+CYTHON_SOURCES = ["sound/*/*.py"]
+CYTHON_EXCLUDE = ["sound/*/__init__.py"]
+
+# Optimization flags for every extension
+COMPILE_ARGS = ["-O3", "-ffast-math"]
+LINK_ARGS = ["-O3"]
+
+# Modules with cython.parallel.prange loops are built with OpenMP when the
+# compiler supports it; otherwise those loops simply run serially
+OPENMP_MODULES = ["sound.effects.surround"]
+OPENMP_ARGS = ["-fopenmp"]
+
+# Route compiler calls through ccache when it is installed and no compiler
+# has been chosen explicitly
+DEFAULT_CC = sysconfig.get_config_var("CC")
+if DEFAULT_CC and "CC" not in os.environ and shutil.which("ccache"):
+    os.environ["CC"] = "ccache " + DEFAULT_CC
+
+# Number of parallel jobs for generating and compiling C sources
+BUILD_JOBS = os.cpu_count() or 1
+
+
+class ParallelBuildExt(build_ext):
+    """build_ext that compiles extensions in parallel unless -j is given."""
+
+    def initialize_options(self):
+        super().initialize_options()
+        self.parallel = BUILD_JOBS
+
+    def build_extensions(self):
+        if not self.compiler_supports_openmp():
+            print("OpenMP is not supported by this compiler; "
+                  "parallel loops will run serially")
+            for ext in self.extensions:
+                ext.extra_compile_args = [arg for arg in ext.extra_compile_args
+                                          if arg not in OPENMP_ARGS]
+                ext.extra_link_args = [arg for arg in ext.extra_link_args
+                                       if arg not in OPENMP_ARGS]
+        super().build_extensions()
+
+    def compiler_supports_openmp(self):
+        """Try to compile and link a small OpenMP program."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "openmp_check.c")
+            with open(source, "w") as f:
+                f.write("#include <omp.h>\n"
+                        "int main(void) { return omp_get_max_threads() > 0 ? 0 : 1; }\n")
+            try:
+                objects = self.compiler.compile(
+                    [source], output_dir=tmp_dir, extra_postargs=OPENMP_ARGS)
+                self.compiler.link_executable(
+                    objects, "openmp_check", output_dir=tmp_dir,
+                    extra_postargs=OPENMP_ARGS)
+            except (CompileError, LinkError):
+                return False
+        return True
+
+
+def cythonize_extensions():
+    """
+    Generate C sources for every module and return the extensions.
+
+    Only called from the __main__ block: with the spawn start method the
+    cythonize worker processes re-import this file as __mp_main__, and
+    must not start a process pool of their own.
+    """
+    # OpenMP modules are declared by name; cythonize skips modules that
+    # already have an explicitly named Extension when expanding the
+    # wildcard template below
+    openmp_extensions = [
+        Extension(
+            module_name,
+            [module_name.replace(".", "/") + ".py"],
+            include_dirs=[numpy.get_include()],
+            extra_compile_args=COMPILE_ARGS + OPENMP_ARGS,
+            extra_link_args=LINK_ARGS + OPENMP_ARGS,
         )
+        for module_name in OPENMP_MODULES
+    ]
+
+    # Template Extension shared by every other matched module
+    extension_template = Extension(
+        "*",
+        CYTHON_SOURCES,
+        include_dirs=[numpy.get_include()],
+        extra_compile_args=COMPILE_ARGS,
+        extra_link_args=LINK_ARGS,
+    )
+
+    # HTML annotation and coverage overlay, only when requested
+    annotation_options = {}
+    if ANNOTATE:
+        annotation_options = {
+            "annotate": True,
+            "annotate_coverage_xml": os.path.join(ANNOTATION_DIR, "coverage.xml"),
+        }
 
-# Cythonize the extensions with organized output directories
-if extensions:
+    # Cythonize the extensions with organized output directories
     extensions = cythonize(
-        extensions,
+        openmp_extensions + [extension_template],
+        exclude=CYTHON_EXCLUDE,
+        nthreads=BUILD_JOBS,  # Generate C files in parallel
+        cache=True,  # Reuse generated C files for unchanged sources
         build_dir=CYTHON_BUILD_DIR,  # Put generated C files here
+        force=ANNOTATE,  # Regenerate everything so each module gets annotated
         compiler_directives={
             "boundscheck": False,
             "wraparound": False,
@@ -55,23 +140,26 @@ if extensions:
             "cdivision": True,
             "language_level": 3,
         },
-        annotate=True,  # Generate HTML annotation files
-        annotate_coverage_xml=os.path.join(ANNOTATION_DIR, "coverage.xml"),
+        **annotation_options,
     )
-    
-    # Move annotation files to the annotations directory
-    import shutil
-    import glob
-    
-    # Find and move .html annotation files
-    for html_file in glob.glob("*.html"):
-        if any(module.replace(".", "_") in html_file for module in cython_modules):
-            dest_path = os.path.join(ANNOTATION_DIR, html_file)
+
+    # Cython writes annotation files next to the generated C files; move
+    # them to the annotations directory, keeping the package layout
+    if ANNOTATE:
+        pattern = os.path.join(CYTHON_BUILD_DIR, "**", "*.html")
+        for html_file in glob.glob(pattern, recursive=True):
+            relative_path = os.path.relpath(html_file, CYTHON_BUILD_DIR)
+            dest_path = os.path.join(ANNOTATION_DIR, relative_path)
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
             shutil.move(html_file, dest_path)
             print(f"Moved annotation file: {html_file} -> {dest_path}")
 
+    return extensions
+
+
 if __name__ == "__main__":
     setup(
-        ext_modules=extensions,
+        ext_modules=cythonize_extensions(),
+        cmdclass={"build_ext": ParallelBuildExt},
         zip_safe=False,
     ) 
\ No newline at end of file
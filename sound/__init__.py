@@ -2,6 +2,11 @@
 Sound Processing Library
 
 A Cython-accelerated library for audio effects, filters, and format handling.
+
+Multichannel buffers passed to the effects, filters and formats keep time on
+the first axis, with shape (num_samples, num_channels). The one exception is
+create_surround_effect, which returns (num_channels, num_samples) so each
+channel is a contiguous row; transpose it with .T before passing it on.
 """
 
 __version__ = "0.1.0"
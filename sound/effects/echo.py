@@ -1,8 +1,32 @@
 """Echo effect implementation with Cython optimizations."""
 
+import cython
 import numpy as np
 
 
+@cython.cfunc
+@cython.inline
+@cython.nogil
+@cython.exceptval(check=False)
+def _echo_loop(samples: cython.const[cython.floating][::1],
+               output: cython.floating[::1],
+               delay_samples: cython.Py_ssize_t,
+               decay_factor: cython.double) -> cython.void:
+    i: cython.Py_ssize_t
+    
+    for i in range(samples.shape[0]):
+        output[i + delay_samples] += samples[i] * decay_factor
+
+
+def _echo_kernel(samples: cython.const[cython.floating][::1],
+                 output: cython.floating[::1],
+                 delay_samples: cython.Py_ssize_t,
+                 decay_factor: cython.double):
+    """Add a delayed, decayed copy of samples into output."""
+    with cython.nogil:
+        _echo_loop(samples, output, delay_samples, decay_factor)
+
+
 def apply_echo(samples, delay_samples=8000, decay_factor=0.5):
     """
     Apply echo effect to audio samples.
@@ -25,11 +49,14 @@ def apply_echo(samples, delay_samples=8000, decay_factor=0.5):
     # Copy original samples
     output[:len(samples)] = samples
     
-    # Add delayed echo
-    for i in range(len(samples)):
-        echo_pos = i + delay_samples
-        if echo_pos < output_length:
-            output[echo_pos] += samples[i] * decay_factor
+    # Add delayed echo; the typed kernel only pays off once compiled
+    if cython.compiled and samples.dtype in (np.float32, np.float64):
+        _echo_kernel(np.ascontiguousarray(samples), output, delay_samples, decay_factor)
+    else:
+        # The tail slice is exactly len(samples) long; integer buffers
+        # truncate the echo just as a per-sample += would
+        tail = output[delay_samples:]
+        np.add(tail, samples * decay_factor, out=tail, casting='unsafe')
     
     return output
 
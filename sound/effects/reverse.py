@@ -27,11 +27,15 @@ def reverse_segments(samples, segment_length=1024):
     Returns:
         numpy array with segments reversed
     """
-    output = samples.copy()
+    num_samples = len(samples)
+    full_length = (num_samples // segment_length) * segment_length
+    segments = samples[:full_length].reshape(-1, segment_length, *samples.shape[1:])
+    
+    output = np.empty_like(samples)
     
-    for i in range(0, len(samples), segment_length):
-        end_idx = min(i + segment_length, len(samples))
-        output[i:end_idx] = samples[i:end_idx][::-1]
+    # Reverse every full segment at once, then the shorter tail segment
+    output[:full_length] = segments[:, ::-1].reshape(full_length, *samples.shape[1:])
+    output[full_length:] = samples[full_length:][::-1]
     
     return output
 
@@ -48,14 +52,21 @@ def gate_reverse(samples, threshold=0.1, gate_length=512):
     Returns:
         numpy array with conditional reverse effect
     """
+    num_samples = len(samples)
+    full_length = (num_samples // gate_length) * gate_length
+    segments = samples[:full_length].reshape(-1, gate_length, *samples.shape[1:])
+    
     output = samples.copy()
+    output_segments = output[:full_length].reshape(segments.shape)
+    
+    # Check which full segments exceed threshold and reverse only those
+    peaks = np.max(np.abs(segments), axis=tuple(range(1, segments.ndim)), initial=0)
+    loud = peaks > threshold
+    output_segments[loud] = segments[loud, ::-1]
     
-    for i in range(0, len(samples), gate_length):
-        end_idx = min(i + gate_length, len(samples))
-        segment = samples[i:end_idx]
-        
-        # Check if segment exceeds threshold
-        if np.max(np.abs(segment)) > threshold:
-            output[i:end_idx] = segment[::-1]
+    # Then the shorter tail segment
+    tail = samples[full_length:]
+    if len(tail) > 0 and np.max(np.abs(tail)) > threshold:
+        output[full_length:] = tail[::-1]
     
     return output
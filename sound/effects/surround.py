@@ -1,6 +1,9 @@
 """Surround sound effect implementation with Cython optimizations."""
 
+import cython
+from cython.parallel import prange
 import numpy as np
+from scipy.signal import lfilter
 
 
 def create_surround_effect(mono_samples, pan_positions=None):
@@ -12,32 +15,64 @@ def create_surround_effect(mono_samples, pan_positions=None):
         pan_positions: list of pan positions (-1.0 to 1.0) for each channel
     
     Returns:
-        numpy array with multiple channels for surround effect
+        numpy array of shape (num_channels, num_samples), one contiguous
+        row per channel
     """
     if pan_positions is None:
         # Default 5.1 surround positions
         pan_positions = [-0.8, 0.8, 0.0, -0.5, 0.5]  # L, R, C, LS, RS
     
-    num_channels = len(pan_positions)
-    output = np.zeros((len(mono_samples), num_channels), dtype=mono_samples.dtype)
-    
-    for ch, pan in enumerate(pan_positions):
-        # Apply panning law (constant power)
-        if pan <= 0:
-            # Left side
-            left_gain = 1.0
-            right_gain = (pan + 1.0) * 0.5
-        else:
-            # Right side  
-            left_gain = (1.0 - pan) * 0.5
-            right_gain = 1.0
-        
-        # Apply gain based on position
-        output[:, ch] = mono_samples * np.sqrt(left_gain * right_gain)
+    pans = np.asarray(pan_positions, dtype=np.float64)
+    
+    # Apply panning law (constant power); left side for pan <= 0, right
+    # side otherwise
+    left_gains = np.where(pans <= 0, 1.0, (1.0 - pans) * 0.5)
+    right_gains = np.where(pans <= 0, (pans + 1.0) * 0.5, 1.0)
+    gains = np.sqrt(left_gains * right_gains)
+    
+    # Apply gain based on position to every channel at once
+    output = np.empty((len(pans), len(mono_samples)), dtype=mono_samples.dtype)
+    np.multiply(gains[:, np.newaxis], mono_samples, out=output, casting='unsafe')
     
     return output
 
 
+@cython.cfunc
+@cython.inline
+@cython.nogil
+@cython.exceptval(check=False)
+def _reverb_loop(samples: cython.const[cython.floating][::1],
+                 damped_samples: cython.const[cython.floating][::1],
+                 output: cython.floating[::1],
+                 delay_times: cython.const[cython.Py_ssize_t][::1],
+                 gains: cython.const[cython.double][::1]) -> cython.void:
+    i: cython.Py_ssize_t
+    k: cython.Py_ssize_t
+    src: cython.Py_ssize_t
+    n: cython.Py_ssize_t = samples.shape[0]
+    acc: cython.double
+    
+    # Each output sample gathers its own reflections, so threads never
+    # write to the same position
+    for i in prange(output.shape[0], schedule='static'):
+        acc = samples[i] if i < n else 0.0
+        for k in range(delay_times.shape[0]):
+            src = i - delay_times[k]
+            if src >= 0 and src < n:
+                acc = acc + damped_samples[src] * gains[k]
+        output[i] = acc
+
+
+def _reverb_kernel(samples: cython.const[cython.floating][::1],
+                   damped_samples: cython.const[cython.floating][::1],
+                   output: cython.floating[::1],
+                   delay_times: cython.const[cython.Py_ssize_t][::1],
+                   gains: cython.const[cython.double][::1]):
+    """Mix samples and their delayed, damped reflections into output."""
+    with cython.nogil:
+        _reverb_loop(samples, damped_samples, output, delay_times, gains)
+
+
 def apply_room_reverb(samples, room_size=0.5, damping=0.3):
     """
     Apply room reverb to create spatial effect.
@@ -61,23 +96,37 @@ def apply_room_reverb(samples, room_size=0.5, damping=0.3):
     # Corresponding gains
     gains = [0.4, 0.3, 0.2, 0.1]
     
-    # Apply damping (simple low-pass filter)
-    damped_samples = samples.copy()
-    if damping > 0:
-        for i in range(1, len(damped_samples)):
-            damped_samples[i] = (1 - damping) * damped_samples[i] + damping * damped_samples[i-1]
+    # Apply damping (simple low-pass filter); the initial state makes the
+    # first output sample equal to the first input sample
+    damped_samples = samples
+    if damping > 0 and len(samples) > 0:
+        # Coefficients in the sample dtype keep float32 audio in float32
+        filter_dtype = np.result_type(samples, np.float32)
+        damped_samples = lfilter(np.array([1 - damping], dtype=filter_dtype),
+                                 np.array([1.0, -damping], dtype=filter_dtype),
+                                 samples,
+                                 zi=np.array([damping * samples[0]], dtype=filter_dtype))[0]
     
     # Create output buffer
     max_delay = max(delay_times)
     output = np.zeros(len(samples) + max_delay, dtype=samples.dtype)
-    output[:len(samples)] = samples
     
-    # Add reflections
-    for delay, gain in zip(delay_times, gains):
-        for i in range(len(samples)):
-            output_pos = i + delay
-            if output_pos < len(output):
-                output[output_pos] += damped_samples[i] * gain
+    # Compiled builds mix the dry signal and every reflection of float
+    # buffers in one parallel pass
+    if cython.compiled and samples.dtype in (np.float32, np.float64):
+        _reverb_kernel(np.ascontiguousarray(samples),
+                       np.ascontiguousarray(damped_samples, dtype=samples.dtype),
+                       output,
+                       np.array(delay_times, dtype=np.intp),
+                       np.array(gains, dtype=np.float64))
+    else:
+        output[:len(samples)] = samples
+        
+        # Otherwise add one reflection slice per tap; the float reflections
+        # are cast down when the output buffer holds integers
+        for delay, gain in zip(delay_times, gains):
+            reflection = output[delay:delay + len(samples)]
+            np.add(reflection, damped_samples * gain, out=reflection, casting='unsafe')
     
     return output
 
@@ -103,7 +152,15 @@ def doppler_effect(samples, velocity_factor=1.0):
     # Create new time indices
     new_indices = np.linspace(0, original_length - 1, new_length)
     
-    # Interpolate samples
-    output = np.interp(new_indices, np.arange(original_length), samples)
+    # Interpolate samples, keeping float32 input in float32. The original
+    # samples sit on a uniform grid, so each position's left neighbour is
+    # just its integer part and no search is needed.
+    source = samples.astype(np.result_type(samples, np.float32), copy=False)
+    left = new_indices.astype(np.intp)
+    right = np.minimum(left + 1, original_length - 1)
+    fraction = (new_indices - left).astype(source.dtype)
+    
+    output = source[left]
+    output += (source[right] - output) * fraction
     
     return output
@@ -43,6 +43,37 @@ def vocal_isolation(left_channel, right_channel):
     return (left + right) * 0.5
 
 
+def _mix_windows(left_windows, right_windows, threshold):
+    """
+    Remove vocals from each window whose channels are strongly correlated.
+    
+    Args:
+        left_windows: 2D numpy array with one left channel window per row
+        right_windows: 2D numpy array with one right channel window per row
+        threshold: correlation threshold for vocal removal
+    
+    Returns:
+        2D numpy array with one processed window per row
+    """
+    # Pearson correlation of each pair of rows
+    left_centered = left_windows - left_windows.mean(axis=1, keepdims=True)
+    right_centered = right_windows - right_windows.mean(axis=1, keepdims=True)
+    numerator = np.einsum('ij,ij->i', left_centered, right_centered)
+    denominator = np.sqrt(np.einsum('ij,ij->i', left_centered, left_centered) *
+                          np.einsum('ij,ij->i', right_centered, right_centered))
+    
+    # Silent windows give NaN, which never counts as vocal content
+    with np.errstate(divide='ignore', invalid='ignore'):
+        correlation = numerator / denominator
+    
+    # If high correlation, likely vocal content - remove it; otherwise keep
+    # the original stereo image for instruments
+    vocal = np.abs(correlation) > threshold
+    return np.where(vocal[:, np.newaxis],
+                    left_windows - right_windows,
+                    (left_windows + right_windows) * 0.5)
+
+
 def dynamic_vocal_removal(left_channel, right_channel, threshold=0.3):
     """
     Dynamically remove vocals based on correlation between channels.
@@ -61,24 +92,24 @@ def dynamic_vocal_removal(left_channel, right_channel, threshold=0.3):
     
     # Window size for correlation analysis
     window_size = 1024
-    output = np.zeros(min_length)
-    
-    for i in range(0, min_length, window_size):
-        end_idx = min(i + window_size, min_length)
-        left_window = left[i:end_idx]
-        right_window = right[i:end_idx]
-        
-        # Calculate correlation
-        if len(left_window) > 1:
-            correlation = np.corrcoef(left_window, right_window)[0, 1]
-            
-            # If high correlation, likely vocal content - remove it
-            if abs(correlation) > threshold:
-                output[i:end_idx] = left_window - right_window
-            else:
-                # Keep original stereo image for instruments
-                output[i:end_idx] = (left_window + right_window) * 0.5
-        else:
-            output[i:end_idx] = left_window
+    output = np.zeros(min_length, dtype=np.result_type(left, right, np.float32))
+    
+    # Process every full window in one batch
+    full_length = (min_length // window_size) * window_size
+    output[:full_length] = _mix_windows(
+        left[:full_length].reshape(-1, window_size),
+        right[:full_length].reshape(-1, window_size),
+        threshold,
+    ).reshape(-1)
+    
+    # Then the shorter tail window, if any
+    if min_length - full_length > 1:
+        output[full_length:] = _mix_windows(
+            left[full_length:].reshape(1, -1),
+            right[full_length:].reshape(1, -1),
+            threshold,
+        ).reshape(-1)
+    else:
+        output[full_length:] = left[full_length:]
     
     return output
@@ -1,8 +1,32 @@
 """Synthesis filter implementation with Cython optimizations."""
 
+import cython
 import numpy as np
 
 
+def _oscillator_phase(frequency, duration, sample_rate):
+    """
+    Compute the oscillator phase for each sample.
+    
+    Args:
+        frequency: frequency in Hz
+        duration: duration in seconds
+        sample_rate: sample rate in Hz
+    
+    Returns:
+        float32 numpy array of phase values (0.0 to 1.0)
+    """
+    num_samples = int(duration * sample_rate)
+    
+    # Count cycles in float64 and keep only the fraction, which float32
+    # holds accurately however long the signal is
+    cycles = np.arange(num_samples, dtype=np.float64)
+    if num_samples > 0:
+        cycles *= frequency * duration / num_samples
+    np.remainder(cycles, 1.0, out=cycles)
+    return cycles.astype(np.float32)
+
+
 def generate_sine_wave(frequency, duration, sample_rate=44100, amplitude=0.5):
     """
     Generate a sine wave.
@@ -14,11 +38,14 @@ def generate_sine_wave(frequency, duration, sample_rate=44100, amplitude=0.5):
         amplitude: amplitude (0.0 to 1.0)
     
     Returns:
-        numpy array of sine wave samples
+        float32 numpy array of sine wave samples
     """
-    num_samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, num_samples, endpoint=False)
-    return amplitude * np.sin(2 * np.pi * frequency * t)
+    # Build phase, sine and gain in place in one buffer
+    output = _oscillator_phase(frequency, duration, sample_rate)
+    output *= 2 * np.pi
+    np.sin(output, out=output)
+    output *= amplitude
+    return output
 
 
 def generate_sawtooth_wave(frequency, duration, sample_rate=44100, amplitude=0.5):
@@ -32,14 +59,14 @@ def generate_sawtooth_wave(frequency, duration, sample_rate=44100, amplitude=0.5
         amplitude: amplitude (0.0 to 1.0)
     
     Returns:
-        numpy array of sawtooth wave samples
+        float32 numpy array of sawtooth wave samples
     """
-    num_samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, num_samples, endpoint=False)
-    
     # Generate sawtooth using phase accumulation
-    phase = (frequency * t) % 1.0
-    return amplitude * (2 * phase - 1)
+    output = _oscillator_phase(frequency, duration, sample_rate)
+    output *= 2
+    output -= 1
+    output *= amplitude
+    return output
 
 
 def generate_square_wave(frequency, duration, sample_rate=44100, amplitude=0.5, duty_cycle=0.5):
@@ -54,14 +81,12 @@ def generate_square_wave(frequency, duration, sample_rate=44100, amplitude=0.5,
         duty_cycle: duty cycle (0.0 to 1.0)
     
     Returns:
-        numpy array of square wave samples
+        float32 numpy array of square wave samples
     """
-    num_samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, num_samples, endpoint=False)
+    phase = _oscillator_phase(frequency, duration, sample_rate)
     
     # Generate square wave
-    phase = (frequency * t) % 1.0
-    return amplitude * np.where(phase < duty_cycle, 1.0, -1.0)
+    return np.where(phase < duty_cycle, np.float32(amplitude), np.float32(-amplitude))
 
 
 def apply_adsr_envelope(samples, attack_time=0.1, decay_time=0.1, sustain_level=0.7, release_time=0.2, sample_rate=44100):
@@ -80,7 +105,6 @@ def apply_adsr_envelope(samples, attack_time=0.1, decay_time=0.1, sustain_level=
         numpy array with ADSR envelope applied
     """
     total_samples = len(samples)
-    envelope = np.zeros(total_samples)
     
     attack_samples = int(attack_time * sample_rate)
     decay_samples = int(decay_time * sample_rate)
@@ -98,30 +122,79 @@ def apply_adsr_envelope(samples, attack_time=0.1, decay_time=0.1, sustain_level=
             decay_samples = int(decay_samples * scale_factor)
             release_samples = total_samples - attack_samples - decay_samples
     
+    # Corner points of the piecewise-linear envelope; a phase of n samples
+    # ramps from its start level to its end level over n positions
+    positions = []
+    levels = []
     current_pos = 0
-    
-    # Attack phase
-    if attack_samples > 0:
-        envelope[current_pos:current_pos + attack_samples] = np.linspace(0, 1, attack_samples)
-        current_pos += attack_samples
-    
-    # Decay phase
-    if decay_samples > 0:
-        envelope[current_pos:current_pos + decay_samples] = np.linspace(1, sustain_level, decay_samples)
-        current_pos += decay_samples
-    
-    # Sustain phase
-    if sustain_samples > 0:
-        envelope[current_pos:current_pos + sustain_samples] = sustain_level
-        current_pos += sustain_samples
-    
-    # Release phase
-    if release_samples > 0:
-        envelope[current_pos:current_pos + release_samples] = np.linspace(sustain_level, 0, release_samples)
+    for phase_samples, start_level, end_level in (
+        (attack_samples, 0.0, 1.0),
+        (decay_samples, 1.0, sustain_level),
+        (sustain_samples, sustain_level, sustain_level),
+        (release_samples, sustain_level, 0.0),
+    ):
+        if phase_samples > 0:
+            positions.append(current_pos)
+            levels.append(start_level)
+            if phase_samples > 1:
+                positions.append(current_pos + phase_samples - 1)
+                levels.append(end_level)
+            current_pos += phase_samples
+    
+    # Evaluate every phase in a single pass
+    envelope = np.zeros(total_samples, dtype=np.float32)
+    if positions:
+        envelope[:] = np.interp(np.arange(total_samples), positions, levels, right=0.0)
     
     return samples * envelope
 
 
+@cython.cfunc
+@cython.inline
+@cython.nogil
+@cython.exceptval(check=False)
+def _low_pass_loop(samples: cython.const[cython.floating][::1],
+                   output: cython.floating[::1],
+                   alpha: cython.double,
+                   resonance: cython.double) -> cython.void:
+    i: cython.Py_ssize_t
+    y: cython.double
+    feedback_gain: cython.double = (resonance - 1.0) * 0.1
+    
+    if samples.shape[0] == 0:
+        return
+    
+    y = samples[0] * alpha
+    output[0] = y
+    
+    for i in range(1, samples.shape[0]):
+        y = alpha * samples[i] + (1 - alpha) * y
+        
+        # Add resonance by feeding back some of the output
+        if resonance > 1.0:
+            y += y * feedback_gain
+            if y > 1.0:
+                y = 1.0
+            elif y < -1.0:
+                y = -1.0
+        
+        output[i] = y
+
+
+def _low_pass_kernel(samples: cython.const[cython.floating][::1],
+                     output: cython.floating[::1],
+                     alpha: cython.double,
+                     resonance: cython.double):
+    """
+    Run the one-pole low-pass recurrence over samples into output.
+    
+    Typed so that Cython compiles the loop to native code and runs it
+    without the GIL; uncompiled it still runs as plain Python.
+    """
+    with cython.nogil:
+        _low_pass_loop(samples, output, alpha, resonance)
+
+
 def low_pass_filter(samples, cutoff_freq, sample_rate=44100, resonance=1.0):
     """
     Apply a simple low-pass filter.
@@ -140,17 +213,16 @@ def low_pass_filter(samples, cutoff_freq, sample_rate=44100, resonance=1.0):
     rc = 1.0 / (2 * np.pi * cutoff_freq)
     alpha = dt / (rc + dt)
     
+    # The kernel filters one contiguous float32 or float64 channel at a
+    # time, so lay multichannel (N, C) input out as one row per channel
+    samples = np.asarray(samples)
+    samples = samples.astype(np.result_type(samples, np.float32), copy=False)
+    num_channels = int(np.prod(samples.shape[1:]))
+    channels = np.ascontiguousarray(samples.reshape(len(samples), num_channels).T)
+    
     # Apply filter
-    output = np.zeros_like(samples)
-    if len(samples) > 0:
-        output[0] = samples[0] * alpha
-        
-        for i in range(1, len(samples)):
-            output[i] = alpha * samples[i] + (1 - alpha) * output[i-1]
-            
-            # Add resonance by feeding back some of the output
-            if resonance > 1.0:
-                feedback = output[i] * (resonance - 1.0) * 0.1
-                output[i] = np.clip(output[i] + feedback, -1.0, 1.0)
+    output = np.zeros_like(channels)
+    for channel, output_channel in zip(channels, output):
+        _low_pass_kernel(channel, output_channel, alpha, resonance)
     
-    return output
+    return output.T.reshape(samples.shape)
@@ -4,6 +4,13 @@ import numpy as np
 import struct
 
 
+# Precompiled layouts for the RIFF header, the fmt chunk fields and the
+# generic chunk header
+_RIFF_HEADER = struct.Struct('<4sI4s')
+_FMT_FIELDS = struct.Struct('<IHHIIHH')
+_CHUNK_HEADER = struct.Struct('<4sI')
+
+
 def read_wave_header(file_data):
     """
     Parse WAV file header.
@@ -18,30 +25,21 @@ def read_wave_header(file_data):
         raise ValueError("Invalid WAV file: too short")
     
     # Parse RIFF header
-    riff_header = file_data[:12]
-    if riff_header[:4] != b'RIFF' or riff_header[8:12] != b'WAVE':
+    riff_id, file_size, wave_id = _RIFF_HEADER.unpack_from(file_data, 0)
+    if riff_id != b'RIFF' or wave_id != b'WAVE':
         raise ValueError("Invalid WAV file: missing RIFF/WAVE header")
     
-    file_size = struct.unpack('<I', riff_header[4:8])[0]
-    
     # Parse fmt chunk
-    fmt_chunk = file_data[12:36]
-    if fmt_chunk[:4] != b'fmt ':
+    if file_data[12:16] != b'fmt ':
         raise ValueError("Invalid WAV file: missing fmt chunk")
     
-    fmt_size = struct.unpack('<I', fmt_chunk[4:8])[0]
-    audio_format = struct.unpack('<H', fmt_chunk[8:10])[0]
-    channels = struct.unpack('<H', fmt_chunk[10:12])[0]
-    sample_rate = struct.unpack('<I', fmt_chunk[12:16])[0]
-    byte_rate = struct.unpack('<I', fmt_chunk[16:20])[0]
-    block_align = struct.unpack('<H', fmt_chunk[20:22])[0]
-    bits_per_sample = struct.unpack('<H', fmt_chunk[22:24])[0]
+    (fmt_size, audio_format, channels, sample_rate,
+     byte_rate, block_align, bits_per_sample) = _FMT_FIELDS.unpack_from(file_data, 16)
     
     # Find data chunk
     offset = 12 + 8 + fmt_size
     while offset < len(file_data) - 8:
-        chunk_id = file_data[offset:offset+4]
-        chunk_size = struct.unpack('<I', file_data[offset+4:offset+8])[0]
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(file_data, offset)
         
         if chunk_id == b'data':
             data_offset = offset + 8
@@ -90,18 +88,13 @@ def read_wave_samples(file_data, header_info):
     elif bits_per_sample == 24:
         # 24-bit samples need special handling
         num_samples = len(audio_data) // 3
-        samples = np.zeros(num_samples, dtype=np.float32)
+        raw = np.frombuffer(audio_data, dtype=np.uint8, count=num_samples * 3)
+        raw = raw.reshape(-1, 3).astype(np.int32)
         
-        for i in range(num_samples):
-            byte_offset = i * 3
-            # Convert 3 bytes to signed 24-bit integer
-            sample_bytes = audio_data[byte_offset:byte_offset + 3]
-            if len(sample_bytes) == 3:
-                # Little-endian 24-bit to 32-bit signed
-                sample_int = struct.unpack('<I', sample_bytes + b'\x00')[0]
-                if sample_int >= 2**23:
-                    sample_int -= 2**24
-                samples[i] = sample_int / (2**23)
+        # Little-endian 24-bit to 32-bit signed
+        packed = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        packed -= (packed & 0x800000) << 1
+        samples = packed.astype(np.float32) / (2**23)
     elif bits_per_sample == 32:
         samples = np.frombuffer(audio_data, dtype=np.float32)
     else: